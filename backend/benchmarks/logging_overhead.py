@@ -0,0 +1,98 @@
+"""Measure the per-request cost of backend logging on the request threads.
+
+Each of ``--threads`` threads emulates ``--requests`` requests (best of ``--repeat`` runs), logging one
+route message and one structured access record per request, the way the
+API does. Output goes to a real file so writes contend as they do on
+stderr under uWSGI. The time reported is what the request threads spend in
+logging calls; for async modes the listener's drain time is shown
+separately, because it is off the request path.
+
+Usage::
+
+    python benchmarks/logging_overhead.py [--threads 8] [--requests 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module  # noqa: E402
+
+MODES = [
+    ("sync text (previous behaviour)", {"mode": "sync", "fmt": "text"}),
+    ("sync json", {"mode": "sync", "fmt": "json"}),
+    ("async json", {"mode": "async", "fmt": "json"}),
+    ("async json, 10% access sampling", {"mode": "async", "fmt": "json", "sample_rate": 0.1}),
+]
+
+
+def _emulate_requests(thread_index: int, requests: int, barrier: threading.Barrier, spent: list) -> None:
+    logger = backend_module.logger
+    access_logger = backend_module.access_logger
+    barrier.wait()
+    started = time.perf_counter()
+    for number in range(requests):
+        logger.info("Created assignment id=%s", number)
+        access_logger.info(
+            "%s %s %s",
+            "POST",
+            "/api/assignments",
+            201,
+            extra={
+                "sample": True,
+                "requestId": f"{thread_index}-{number}",
+                "method": "POST",
+                "route": "/api/assignments",
+                "status": 201,
+                "durationMs": 1.25,
+                "rows": 1,
+            },
+        )
+    spent[thread_index] = time.perf_counter() - started
+
+
+def run(threads: int, requests: int, settings: dict) -> tuple[float, float]:
+    with tempfile.TemporaryFile("w") as output:
+        backend_module.configure_logging(level="INFO", stream=output, **settings)
+        spent = [0.0] * threads
+        barrier = threading.Barrier(threads)
+        workers = [
+            threading.Thread(target=_emulate_requests, args=(index, requests, barrier, spent))
+            for index in range(threads)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        drain_started = time.perf_counter()
+        backend_module._stop_log_listener()
+        drain = time.perf_counter() - drain_started
+    per_request = sum(spent) / (threads * requests)
+    return per_request, drain
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    for label, settings in MODES:
+        per_request, drain = min(run(args.threads, args.requests, settings) for _ in range(args.repeat))
+        print(f"{label:<34} {per_request * 1e6:8.1f} us/request on request threads  (listener drain {drain * 1000:.0f} ms)")
+    backend_module.configure_logging(mode="sync")
+
+
+if __name__ == "__main__":
+    main()
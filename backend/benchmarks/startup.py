@@ -0,0 +1,94 @@
+"""Measure worker startup cost of the backend.
+
+Compares the lazy application factory against the previous eager pattern
+(numpy and brotli imported up front, engine built at import plus a second
+API/engine in ``wsgi.py``) and, when a database is reachable, times the
+optional warm-up and the first query.
+
+Usage::
+
+    python benchmarks/startup.py [--repeat 5] [--warm-up]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+
+def _time_subprocess(setup: str, code: str, repeat: int) -> list[float]:
+    """Run ``code`` in a fresh interpreter after ``setup`` and return its duration."""
+
+    script = (
+        f"{setup}\n"
+        "import time\n"
+        "_started = time.perf_counter()\n"
+        f"{code}\n"
+        "print(time.perf_counter() - _started)\n"
+    )
+    samples = []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-c", script], cwd=BACKEND_ROOT, check=True, capture_output=True, text=True
+        )
+        samples.append(float(completed.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def _report(label: str, samples: list[float]) -> None:
+    print(f"{label:<42} median {statistics.median(samples) * 1000:8.1f} ms  (min {min(samples) * 1000:.1f} ms)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warm-up", action="store_true", help="also time warm_up() against DATABASE_URL")
+    args = parser.parse_args()
+
+    _report("import backend", _time_subprocess("", "import backend", args.repeat))
+    _report(
+        "import backend + numpy/brotli (previous)",
+        _time_subprocess("", "import backend, numpy, brotli", args.repeat),
+    )
+    _report(
+        "lazy: get_api() (single API, no engine)",
+        _time_subprocess("import backend", "backend.get_api()", args.repeat),
+    )
+    _report(
+        "lazy: get_api() + engine on first use",
+        _time_subprocess("import backend", "backend.get_api().connection_provider.engine", args.repeat),
+    )
+    _report(
+        "eager: two APIs + two engines (previous)",
+        _time_subprocess(
+            "import backend",
+            "for _ in range(2):\n"
+            "    backend.ResourcePlannerAPI(backend.DatabaseConfig()).connection_provider.engine",
+            args.repeat,
+        ),
+    )
+
+    if args.warm_up:
+        import backend
+
+        api = backend.get_api()
+        started = time.perf_counter()
+        timings = api.warm_up()
+        print(f"{'warm_up() total':<42} {(time.perf_counter() - started) * 1000:8.1f} ms")
+        for step, seconds in timings.items():
+            print(f"  {step:<40} {seconds * 1000:8.1f} ms")
+        client = api.app.test_client()
+        started = time.perf_counter()
+        response = client.get("/api/people")
+        print(f"{'first GET /api/people after warm-up':<42} {(time.perf_counter() - started) * 1000:8.1f} ms  ({response.status_code})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider
+
+
+@unittest.skipIf(backend_module.np is None, "numpy is not installed")
+class AllocationMatrixTests(unittest.TestCase):
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        feed = backend_module.ChangeFeed(capacity=100)
+        self.people_repo = backend_module.PeopleRepository(provider, feed)
+        self.clients_repo = backend_module.ClientsRepository(provider, feed)
+        self.projects_repo = backend_module.ProjectsRepository(provider, feed)
+        self.assignments_repo = backend_module.AssignmentsRepository(provider, feed)
+        self.matrix = backend_module.AllocationMatrix(
+            self.people_repo, self.projects_repo, self.assignments_repo, feed
+        )
+
+        client_id = self.clients_repo.create("Acme")
+        self.project_id = self.projects_repo.create("Website", client_id)
+        self.ada = self.people_repo.create("Ada", "Engineer")
+        self.grace = self.people_repo.create("Grace", "Engineer")
+        self.linus = self.people_repo.create("Linus", "Manager")
+        # Period 0 is 2026-01-01..2026-01-14.
+        self.assignment_id = self.assignments_repo.create(
+            self.ada, self.project_id, date(2026, 1, 1), date(2026, 1, 14), 100
+        )
+        self.assignments_repo.create(self.grace, self.project_id, date(2026, 1, 8), date(2026, 1, 14), 50)
+        self.period = backend_module.AllocationMatrix.period_range(0)
+
+    def _by_key(self, group_by):
+        return {group["key"]: group for group in self.matrix.utilization(group_by, *self.period)}
+
+    def test_utilization_by_role_and_client(self):
+        roles = self._by_key("role")
+        self.assertEqual(roles["Engineer"]["headcount"], 2)
+        self.assertAlmostEqual(roles["Engineer"]["allocation"], 125.0)
+        self.assertAlmostEqual(roles["Engineer"]["utilization"], 62.5)
+        self.assertEqual(roles["Manager"]["allocation"], 0.0)
+        clients = list(self._by_key("client").values())
+        self.assertAlmostEqual(clients[0]["allocation"], 125.0)
+
+    def test_incremental_updates_follow_the_change_feed(self):
+        self._by_key("person")
+        self.assignments_repo.update(
+            self.assignment_id, self.ada, self.project_id, date(2026, 1, 1), date(2026, 1, 7), 100
+        )
+        self.assertAlmostEqual(self._by_key("person")[self.ada]["utilization"], 50.0)
+        self.assignments_repo.delete(self.assignment_id)
+        self.assertEqual(self._by_key("person")[self.ada]["utilization"], 0.0)
+
+        self.people_repo.create("Barbara", "Designer")
+        self.assertIn("Designer", self._by_key("role"))
+
+    def test_bench_and_peak_weeks(self):
+        bench = self.matrix.bench(*self.period, threshold=50)
+        self.assertEqual([entry["personId"] for entry in bench], [self.linus, self.grace])
+
+        weeks = self.matrix.peak_weeks(date(2025, 12, 29), date(2026, 1, 18), top=1)
+        self.assertEqual(weeks, [{"weekStart": "2026-01-05", "allocation": 128.57}])
+
+
+@unittest.skipIf(backend_module.np is None, "numpy is not installed")
+class AllocationMatrixAcrossWorkersTests(unittest.TestCase):
+    """Two sets of repositories over one database stand in for two uWSGI workers."""
+
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        self.writer = {
+            "people": backend_module.PeopleRepository(provider, backend_module.ChangeFeed()),
+            "clients": backend_module.ClientsRepository(provider, backend_module.ChangeFeed()),
+            "projects": backend_module.ProjectsRepository(provider, backend_module.ChangeFeed()),
+            "assignments": backend_module.AssignmentsRepository(provider, backend_module.ChangeFeed()),
+        }
+        reader = {
+            "people": backend_module.PeopleRepository(provider),
+            "clients": backend_module.ClientsRepository(provider),
+            "projects": backend_module.ProjectsRepository(provider),
+            "assignments": backend_module.AssignmentsRepository(provider),
+        }
+        reader["assignments"].horizon_ttl = 0
+        feed = backend_module.ChangeLogFeed(
+            backend_module.ChangeLogRepository(provider), reader, interval=0
+        )
+        self.matrix = backend_module.AllocationMatrix(
+            reader["people"], reader["projects"], reader["assignments"], feed
+        )
+        self.archive_service = backend_module.ArchiveService(provider)
+        client_id = self.writer["clients"].create("Acme")
+        self.project_id = self.writer["projects"].create("Website", client_id)
+        self.ada = self.writer["people"].create("Ada", "Engineer")
+
+    def _utilization(self, start, end):
+        return {
+            group["key"]: group["utilization"]
+            for group in self.matrix.utilization("person", start, end)
+        }
+
+    def test_writes_on_another_worker_reach_the_matrix(self):
+        period = (date(2026, 1, 1), date(2026, 1, 14))
+        self.assertEqual(self._utilization(*period)[self.ada], 0.0)
+        assignment_id = self.writer["assignments"].create(
+            self.ada, self.project_id, date(2026, 1, 1), date(2026, 1, 14), 100
+        )
+        self.assertAlmostEqual(self._utilization(*period)[self.ada], 100.0)
+        self.writer["assignments"].update(
+            assignment_id, self.ada, self.project_id, date(2026, 1, 1), date(2026, 1, 14), 40
+        )
+        self.assertAlmostEqual(self._utilization(*period)[self.ada], 40.0)
+        self.writer["assignments"].delete(assignment_id)
+        self.assertEqual(self._utilization(*period)[self.ada], 0.0)
+
+    def test_archived_assignments_still_count(self):
+        march = (date(2024, 3, 1), date(2024, 3, 31))
+        self.writer["assignments"].create(self.ada, self.project_id, *march, 100)
+        self.assertAlmostEqual(self._utilization(*march)[self.ada], 100.0)
+
+        self.archive_service.archive_before(date(2025, 1, 1))
+        self.matrix.rebuild()
+        self.assertAlmostEqual(self._utilization(*march)[self.ada], 100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import TEST_DATABASE_URL
+
+TEST_CONFIG = backend_module.DatabaseConfig(database_url=TEST_DATABASE_URL)
+
+
+class AppFactoryTests(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(backend_module, "_api", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_api_builds_one_api_per_process(self):
+        with mock.patch.object(
+            backend_module, "ResourcePlannerAPI", wraps=backend_module.ResourcePlannerAPI
+        ) as constructor:
+            first = backend_module.get_api(TEST_CONFIG)
+            self.assertIs(backend_module.get_api(), first)
+        constructor.assert_called_once_with(TEST_CONFIG)
+        self.assertIs(backend_module.create_app(), first.app)
+
+    def test_get_api_is_safe_under_concurrent_first_use(self):
+        barrier = threading.Barrier(8)
+        results = []
+
+        def build():
+            barrier.wait()
+            results.append(backend_module.get_api(TEST_CONFIG))
+
+        threads = [threading.Thread(target=build) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(api) for api in results}), 1)
+
+    def test_module_attributes_resolve_through_the_factory(self):
+        api = backend_module.get_api(TEST_CONFIG)
+        self.assertIs(backend_module.api, api)
+        self.assertIs(backend_module.app, api.app)
+        self.assertIs(backend_module.config, TEST_CONFIG)
+        with self.assertRaises(AttributeError):
+            backend_module.missing  # noqa: B018
+
+    def test_constructing_the_api_does_not_open_an_engine(self):
+        api = backend_module.get_api(TEST_CONFIG)
+        self.assertIsNone(api.connection_provider._engine)
+
+
+class LazyImportTests(unittest.TestCase):
+    def test_import_does_not_load_numpy_or_brotli(self):
+        completed = subprocess.run(
+            [sys.executable, "-c", "import sys, backend; print(sorted({'numpy', 'brotli'} & set(sys.modules)))"],
+            cwd=BACKEND_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(completed.stdout.strip().splitlines()[-1], "[]")
+
+    def test_lazy_module_imports_on_first_use(self):
+        handle = backend_module._LazyModule("json")
+        self.assertEqual(handle.dumps([1]), "[1]")
+        self.assertIsNone(backend_module._optional_module("no_such_module_for_tests"))
+
+
+class WsgiEntryPointTests(unittest.TestCase):
+    def _import_wsgi(self, warm_up_on_start):
+        api = backend_module.ResourcePlannerAPI(TEST_CONFIG)
+        api.init_database = mock.Mock()
+        warmed = threading.Event()
+        warm_up_threads = []
+
+        def warm_up():
+            warm_up_threads.append(threading.current_thread())
+            warmed.set()
+
+        api.warm_up = warm_up
+        sys.modules.pop("wsgi", None)
+        self.addCleanup(sys.modules.pop, "wsgi", None)
+        with mock.patch.object(backend_module, "_api", api), mock.patch.dict(
+            os.environ, {"WARM_UP_ON_START": warm_up_on_start}
+        ):
+            wsgi = importlib.import_module("wsgi")
+        return api, wsgi, warmed, warm_up_threads
+
+    def test_exposes_the_shared_app_and_initializes_the_schema(self):
+        api, wsgi, warmed, _ = self._import_wsgi("0")
+        self.assertIs(wsgi.app, api.app)
+        api.init_database.assert_called_once_with()
+        self.assertFalse(warmed.wait(0.05))
+
+    def test_warm_up_runs_in_a_background_thread(self):
+        _, _, warmed, warm_up_threads = self._import_wsgi("1")
+        self.assertTrue(warmed.wait(5))
+        self.assertIsNot(warm_up_threads[0], threading.main_thread())
+        self.assertTrue(warm_up_threads[0].daemon)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider
+
+
+class ArchiveServiceTests(unittest.TestCase):
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        self.assignments_repo = backend_module.AssignmentsRepository(provider)
+        self.assignments_repo.horizon_ttl = 0
+        self.service = backend_module.ArchiveService(provider, batch_size=2)
+        self.old_ids = [
+            self.assignments_repo.create(1, 1, date(2024, 1, day), date(2024, 1, day + 10), 50)
+            for day in range(1, 6)
+        ]
+        self.current_id = self.assignments_repo.create(1, 1, date(2026, 1, 1), date(2026, 3, 1), 100)
+
+    def test_archives_in_batches(self):
+        result = self.service.archive_before(date(2025, 1, 1))
+        self.assertEqual(result, {"archived": 5, "batches": 3})
+        self.assertEqual(
+            [row["id"] for row in self.assignments_repo.list(start=date(2025, 1, 1))], [self.current_id]
+        )
+        self.assertEqual(self.assignments_repo.archive_horizon(), date(2024, 1, 15))
+
+    def test_max_batches_limits_a_run(self):
+        result = self.service.archive_before(date(2025, 1, 1), max_batches=1)
+        self.assertEqual(result, {"archived": 2, "batches": 1})
+
+    def test_range_queries_reach_into_archive_only_when_needed(self):
+        self.service.archive_before(date(2025, 1, 1))
+
+        recent = self.assignments_repo.list(start=date(2025, 6, 1))
+        self.assertEqual([row["id"] for row in recent], [self.current_id])
+        history = self.assignments_repo.list(start=date(2024, 1, 12), end=date(2024, 12, 31))
+        self.assertEqual(sorted(row["id"] for row in history), self.old_ids[1:])
+
+    def test_ranges_without_a_start_include_the_archive(self):
+        self.service.archive_before(date(2025, 1, 1))
+        everything = sorted(self.old_ids + [self.current_id])
+
+        self.assertEqual(sorted(row["id"] for row in self.assignments_repo.list()), everything)
+        self.assertEqual(
+            sorted(row["id"] for row in self.assignments_repo.list(end=date(2026, 12, 31))), everything
+        )
+        columns = self.assignments_repo.list_columns()
+        self.assertEqual(sorted(columns["id"]), everything)
+
+    def test_other_workers_see_the_archive_at_once(self):
+        other_repo = backend_module.AssignmentsRepository(self.assignments_repo._connection_provider)
+        self.assertEqual(len(other_repo.list(start=date(2024, 1, 1), end=date(2024, 1, 31))), 5)
+        self.assertIsNone(other_repo.archive_horizon())
+
+        self.service.archive_before(date(2025, 1, 1))
+        self.assertEqual(len(other_repo.list(start=date(2024, 1, 1), end=date(2024, 1, 31))), 5)
+        self.assertEqual(len(other_repo.list()), 6)
+        self.assertEqual(len(other_repo.get_many(self.old_ids)), 5)
+
+    def test_archived_natural_key_still_blocks_duplicates(self):
+        self.service.archive_before(date(2025, 1, 1))
+        archived_key = (1, 1, date(2024, 1, 1), date(2024, 1, 11))
+
+        with self.assertRaises(backend_module.ConflictError) as context:
+            self.assignments_repo.create(*archived_key, 75)
+        self.assertEqual(context.exception.existing_id, self.old_ids[0])
+        with self.assertRaises(backend_module.ConflictError):
+            self.assignments_repo.update(self.current_id, *archived_key, 75)
+        with self.assertRaises(backend_module.ConflictError):
+            self.assignments_repo.update(self.old_ids[1], 1, 1, date(2026, 1, 1), date(2026, 3, 1), 75)
+        self.assertEqual(len(self.assignments_repo.list()), 6)
+        self.assertEqual(self.assignments_repo.get_many([self.current_id])[0]["percentage"], 100)
+
+        # Updating a row without touching its key is not a conflict with itself.
+        self.assignments_repo.update(self.old_ids[0], *archived_key, 25)
+
+    def test_archived_rows_remain_addressable(self):
+        self.service.archive_before(date(2025, 1, 1))
+        archived_id = self.old_ids[0]
+
+        found = self.assignments_repo.find_existing(1, 1, date(2024, 1, 1), date(2024, 1, 11))
+        self.assertEqual(found, archived_id)
+        self.assignments_repo.update(archived_id, 1, 1, date(2024, 1, 1), date(2024, 1, 11), 25)
+        rows = self.assignments_repo.get_many([archived_id])
+        self.assertEqual(rows[0]["percentage"], 25)
+        self.assignments_repo.delete(archived_id)
+        self.assertEqual(self.assignments_repo.get_many([archived_id]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
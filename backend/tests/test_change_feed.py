@@ -0,0 +1,98 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import make_api
+
+
+class ChangeFeedTests(unittest.TestCase):
+    def test_since_returns_events_after_cursor(self):
+        feed = backend_module.ChangeFeed(capacity=10)
+        feed.publish("people", "create", 1, {"id": 1, "name": "Ada", "role": "Engineer"})
+        feed.publish("people", "delete", 1)
+
+        events, complete = feed.since(1)
+        self.assertTrue(complete)
+        self.assertEqual([event["op"] for event in events], ["delete"])
+        self.assertEqual(feed.last_id, 2)
+
+    def test_since_reports_gap_after_eviction(self):
+        feed = backend_module.ChangeFeed(capacity=2)
+        for person_id in range(1, 5):
+            feed.publish("people", "delete", person_id)
+
+        events, complete = feed.since(1)
+        self.assertFalse(complete)
+        self.assertEqual([event["id"] for event in events], [3, 4])
+        _, complete = feed.since(2)
+        self.assertTrue(complete)
+
+    def test_wait_times_out_without_events(self):
+        feed = backend_module.ChangeFeed(capacity=2)
+        events, complete = feed.wait(feed.last_id, timeout=0.01)
+        self.assertEqual(events, [])
+        self.assertTrue(complete)
+
+    @unittest.skipIf(backend_module.fcntl is None, "file-backed feed requires fcntl")
+    def test_file_backed_feed_is_shared_between_instances(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = str(Path(temp_dir) / "changes.jsonl")
+            writer = backend_module.ChangeFeed(path=path, capacity=3)
+            reader = backend_module.ChangeFeed(path=path, capacity=3)
+
+            writer.publish(
+                "assignments",
+                "create",
+                7,
+                {"id": 7, "start_date": date(2026, 1, 1), "end_date": date(2026, 1, 14)},
+            )
+            events, complete = reader.since(0)
+            self.assertTrue(complete)
+            self.assertEqual(events[0]["row"]["start_date"], "2026-01-01")
+
+            # Interleaved writers share one sequence and survive compaction.
+            for assignment_id in range(8, 16):
+                (reader if assignment_id % 2 else writer).publish("assignments", "delete", assignment_id)
+            self.assertEqual(writer.last_id, 9)
+            events, complete = reader.since(6)
+            self.assertTrue(complete)
+            self.assertEqual([event["entityId"] for event in events], [13, 14, 15])
+            self.assertFalse(reader.since(1)[1])
+
+
+class EventStreamLimitTests(unittest.TestCase):
+    def _api(self):
+        return make_api()
+
+    @mock.patch.dict(os.environ, {"CHANGE_FEED_MAX_STREAMS": "1"})
+    def test_streams_beyond_the_cap_get_503_until_one_closes(self):
+        client = self._api().app.test_client()
+        first = client.get("/api/events", buffered=False)
+        self.assertEqual(first.status_code, 200)
+        second = client.get("/api/events", buffered=False)
+        self.assertEqual((second.status_code, second.headers["Retry-After"]), (503, "30"))
+
+        first.close()
+        third = client.get("/api/events", buffered=False)
+        self.assertEqual(third.status_code, 200)
+        third.close()
+
+    def test_memory_feed_is_refused_with_several_workers(self):
+        environ = {key: value for key, value in os.environ.items() if key != "CHANGE_FEED_PATH"}
+        with mock.patch.dict(os.environ, environ, clear=True), mock.patch.object(
+            backend_module, "_uwsgi_processes", return_value=4
+        ):
+            with self.assertRaises(RuntimeError):
+                self._api()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import struct
+import sys
+import unittest
+from array import array
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import text
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider, make_api
+
+
+class ColumnarPayloadTests(unittest.TestCase):
+    def setUp(self):
+        provider = self.provider = SQLiteConnectionProvider()
+        self.api = make_api(provider)
+        person_id = self.api.people_repo.create("Ada", "Engineer")
+        project_id = self.api.projects_repo.create("Website", 1)
+        self.assignment_ids = [
+            self.api.assignments_repo.create(
+                person_id, project_id, date(2026, 1, day), date(2026, 1, day + 13), 50
+            )
+            for day in (1, 15)
+        ]
+        self.person_id, self.project_id = person_id, project_id
+        self.client = self.api.app.test_client()
+        self.start_day = (date(2026, 1, 1) - date(1970, 1, 1)).days
+
+    def test_columnar_json_holds_parallel_arrays(self):
+        response = self.client.get("/api/assignments", headers={"Accept": backend_module.COLUMNAR_JSON})
+        self.assertEqual(response.mimetype, backend_module.COLUMNAR_JSON)
+        payload = response.get_json(force=True)
+        self.assertEqual(payload["count"], 2)
+        self.assertEqual(payload["columns"]["id"], self.assignment_ids)
+        self.assertEqual(payload["columns"]["startDay"], [self.start_day, self.start_day + 14])
+        self.assertEqual(payload["columns"]["percentage"], [50, 50])
+
+    def test_binary_encoding_is_int32_blocks_after_header(self):
+        response = self.client.get("/api/assignments", headers={"Accept": backend_module.COLUMNAR_BINARY})
+        magic, version, column_count, _, count = struct.unpack_from("<4sBBHI", response.data)
+        self.assertEqual((magic, version, column_count, count), (b"EPCA", 1, 7, 2))
+        blocks = array("i", response.data[12:])
+        if sys.byteorder != "little":
+            blocks.byteswap()
+        columns = {
+            name: blocks[index * count : (index + 1) * count]
+            for index, name in enumerate(backend_module.COLUMNAR_FIELDS)
+        }
+        self.assertEqual(list(columns["personId"]), [self.person_id] * 2)
+        self.assertEqual(list(columns["endDay"]), [self.start_day + 13, self.start_day + 27])
+
+    def test_null_percentage_is_sent_as_zero(self):
+        with self.provider.get_connection() as conn:
+            conn.execute(
+                text("UPDATE assignments SET percentage = NULL WHERE id = :id"),
+                {"id": self.assignment_ids[0]},
+            )
+        columns = self.api.assignments_repo.list_columns()
+        self.assertEqual(list(columns["percentage"]), [0, 50])
+        response = self.client.get("/api/assignments", headers={"Accept": backend_module.COLUMNAR_JSON})
+        self.assertEqual(response.get_json(force=True)["columns"]["percentage"], [0, 50])
+
+    def test_default_accept_keeps_row_objects(self):
+        rows = self.client.get("/api/assignments", headers={"Accept": "*/*"}).get_json()
+        self.assertEqual(rows[0]["start_date"], "2026-01-01")
+
+    def test_snapshot_returns_assignment_columns(self):
+        service = backend_module.DeltaSyncService(
+            self.api.change_log_repo,
+            {"assignments": self.api.assignments_repo},
+        )
+        snapshot = service.changes_since(None, columnar=True)
+        self.assertTrue(snapshot["reset"])
+        self.assertEqual(list(snapshot["assignments"]["columns"]["id"]), self.assignment_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import gzip
+import sys
+import unittest
+import zlib
+from pathlib import Path
+
+from flask import Flask, Response, jsonify
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+
+ROWS = [{"id": index, "person_id": 1, "project_id": 2, "percentage": 50} for index in range(200)]
+
+
+class ResponseCompressorTests(unittest.TestCase):
+    def setUp(self):
+        self.compressor = backend_module.ResponseCompressor(min_size=256)
+        app = Flask(__name__)
+        app.after_request(self.compressor)
+
+        @app.route("/rows")
+        def rows():
+            return jsonify(ROWS)
+
+        @app.route("/small")
+        def small():
+            return jsonify({"ok": True})
+
+        @app.route("/stream")
+        def stream():
+            return Response((f"data: {index}\n\n" for index in range(3)), mimetype="text/event-stream")
+
+        self.client = app.test_client()
+
+    def test_gzip_is_negotiated_and_cached(self):
+        response = self.client.get("/rows", headers={"Accept-Encoding": "gzip;q=1.0, br;q=0.5"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+        self.assertEqual(gzip.decompress(response.data), self.client.get("/rows").data)
+        self.assertLess(len(response.data), len(self.client.get("/rows").data) / 5)
+
+        again = self.client.get("/rows", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(again.data, response.data)
+        self.assertEqual(len(self.compressor._cache), 1)
+
+    def test_small_and_unaccepted_responses_are_left_alone(self):
+        small = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", small.headers)
+        plain = self.client.get("/rows", headers={"Accept-Encoding": "gzip;q=0"})
+        self.assertNotIn("Content-Encoding", plain.headers)
+
+    @unittest.skipIf(backend_module.brotli is None, "brotli is not installed")
+    def test_brotli_is_preferred_when_available(self):
+        response = self.client.get("/rows", headers={"Accept-Encoding": "gzip, deflate, br"})
+        self.assertEqual(response.headers["Content-Encoding"], "br")
+        self.assertEqual(backend_module.brotli.decompress(response.data), self.client.get("/rows").data)
+
+    def test_streams_are_compressed_chunk_by_chunk(self):
+        response = self.client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        chunks = list(response.response)
+        # Every chunk is flushed, so the first event decodes on its own.
+        self.assertEqual(decompressor.decompress(chunks[0]), b"data: 0\n\n")
+        self.assertEqual(
+            gzip.decompress(b"".join(chunks)), b"".join(f"data: {index}\n\n".encode() for index in range(3))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
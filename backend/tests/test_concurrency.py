@@ -0,0 +1,139 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider, make_api
+
+
+class AssignmentConcurrencyTests(unittest.TestCase):
+    def setUp(self):
+        self.provider = SQLiteConnectionProvider()
+        self.people_repo = backend_module.PeopleRepository(self.provider)
+        self.clients_repo = backend_module.ClientsRepository(self.provider)
+        self.projects_repo = backend_module.ProjectsRepository(self.provider)
+        self.assignments_repo = backend_module.AssignmentsRepository(self.provider)
+        self.person_id = self.people_repo.create("Ada", "Engineer")
+        self.project_id = self.projects_repo.create("Website", self.clients_repo.create("Acme"))
+
+    def _row(self, percentage=50):
+        return {
+            "person_id": self.person_id,
+            "project_id": self.project_id,
+            "start_date": date(2026, 1, 1),
+            "end_date": date(2026, 1, 14),
+            "percentage": percentage,
+        }
+
+    def test_upsert_updates_rows_that_already_exist(self):
+        first = self.assignments_repo.upsert_many([self._row(50)])
+        second = self.assignments_repo.upsert_many([self._row(80), self._row(90)])
+        rows = self.assignments_repo.list()
+        self.assertEqual(first, second[:1])
+        self.assertEqual(len(rows), 1)
+        self.assertEqual((rows[0]["percentage"], rows[0]["version"]), (90, 3))
+
+    def test_create_duplicate_raises_conflict_with_existing_id(self):
+        assignment_id = self.assignments_repo.create(**self._row())
+        with self.assertRaises(backend_module.ConflictError) as context:
+            self.assignments_repo.create(**self._row(70))
+        self.assertEqual(context.exception.existing_id, assignment_id)
+
+    def test_stale_version_is_rejected(self):
+        assignment_id = self.assignments_repo.create(**self._row())
+        version = self.assignments_repo.update(assignment_id, **self._row(60), expected_version=1)
+        self.assertEqual(version, 2)
+        with self.assertRaises(backend_module.ConflictError) as context:
+            self.assignments_repo.update(assignment_id, **self._row(70), expected_version=1)
+        self.assertEqual(context.exception.current_version, 2)
+        self.assertEqual(self.assignments_repo.list()[0]["percentage"], 60)
+
+    def test_update_of_a_missing_row_raises_not_found_without_publishing(self):
+        feed = backend_module.ChangeFeed(capacity=10)
+        assignments_repo = backend_module.AssignmentsRepository(self.provider, feed)
+        change_log = backend_module.ChangeLogRepository(self.provider)
+        bounds = change_log.bounds()
+        for expected_version in (None, 1):
+            with self.assertRaises(backend_module.NotFoundError):
+                assignments_repo.update(999, **self._row(), expected_version=expected_version)
+        self.assertEqual(feed.last_id, 0)
+        self.assertEqual(change_log.bounds(), bounds)
+
+    def test_upsert_events_carry_the_row_version(self):
+        feed = backend_module.ChangeFeed(capacity=10)
+        assignments_repo = backend_module.AssignmentsRepository(self.provider, feed)
+        assignments_repo.upsert_many([self._row(50)])
+        assignments_repo.upsert_many([self._row(80)])
+        events, _ = feed.since(0)
+        self.assertEqual([(event["op"], event["row"]["version"]) for event in events], [("create", 1), ("update", 2)])
+
+
+class AssignmentUpdateRouteTests(unittest.TestCase):
+    def setUp(self):
+        provider = self.provider = SQLiteConnectionProvider()
+        self.api = make_api(provider)
+        person_id = self.api.people_repo.create("Ada", "Engineer")
+        project_id = self.api.projects_repo.create("Website", self.api.clients_repo.create("Acme"))
+        self.payload = {
+            "personId": person_id,
+            "projectId": project_id,
+            "startDate": "2026-01-01",
+            "endDate": "2026-01-14",
+            "percentage": 50,
+        }
+        self.assignment_id = self.api.assignments_repo.create(
+            person_id, project_id, date(2026, 1, 1), date(2026, 1, 14), 50
+        )
+        self.client = self.api.app.test_client()
+
+    def test_missing_assignment_is_not_found(self):
+        response = self.client.put("/api/assignments/999", json=self.payload)
+        self.assertEqual(response.status_code, 404)
+
+    def test_posting_an_archived_assignment_again_conflicts(self):
+        backend_module.ArchiveService(self.provider).archive_before(date(2026, 6, 1))
+        response = self.client.post("/api/assignments", json=self.payload)
+        self.assertEqual((response.status_code, response.get_json()["id"]), (409, self.assignment_id))
+        self.assertEqual(len(self.client.get("/api/assignments").get_json()), 1)
+
+    def test_weak_if_match_is_accepted(self):
+        url = f"/api/assignments/{self.assignment_id}"
+        response = self.client.put(url, json=self.payload, headers={"If-Match": 'W/"1"'})
+        self.assertEqual((response.status_code, response.headers["ETag"]), (200, '"2"'))
+        stale = self.client.put(url, json=self.payload, headers={"If-Match": 'W/"1"'})
+        self.assertEqual(stale.status_code, 409)
+
+
+class IdempotencyTests(unittest.TestCase):
+    def setUp(self):
+        self.api = make_api()
+        self.client = self.api.app.test_client()
+
+    def test_retry_replays_the_first_response(self):
+        headers = {"Idempotency-Key": "retry-1"}
+        payload = {"name": "Ada", "role": "Engineer"}
+        first = self.client.post("/api/people", json=payload, headers=headers)
+        retry = self.client.post("/api/people", json=payload, headers=headers)
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual((retry.status_code, retry.json), (201, first.json))
+        self.assertEqual(retry.headers["Idempotent-Replayed"], "true")
+        self.assertEqual(len(self.api.people_repo.list()), 1)
+
+        reused = self.client.post("/api/people", json={"name": "Grace", "role": "Manager"}, headers=headers)
+        self.assertEqual(reused.status_code, 422)
+
+    def test_cache_is_bounded_and_reserves_in_flight_keys(self):
+        cache = backend_module.IdempotencyCache(capacity=2)
+        self.assertEqual(cache.begin(("POST", "/a", "1"), "x")[0], "new")
+        self.assertEqual(cache.begin(("POST", "/a", "1"), "x")[0], "in_progress")
+        cache.begin(("POST", "/a", "2"), "x")
+        cache.begin(("POST", "/a", "3"), "x")
+        self.assertEqual(cache.begin(("POST", "/a", "1"), "x")[0], "new")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import text
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider, make_api
+
+
+class DeltaSyncTests(unittest.TestCase):
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        self.people_repo = backend_module.PeopleRepository(provider)
+        self.clients_repo = backend_module.ClientsRepository(provider)
+        self.projects_repo = backend_module.ProjectsRepository(provider)
+        self.assignments_repo = backend_module.AssignmentsRepository(provider)
+        self.change_log_repo = backend_module.ChangeLogRepository(provider)
+        self.service = backend_module.DeltaSyncService(
+            self.change_log_repo,
+            {
+                "people": self.people_repo,
+                "clients": self.clients_repo,
+                "projects": self.projects_repo,
+                "assignments": self.assignments_repo,
+            },
+        )
+
+    def test_first_sync_returns_snapshot(self):
+        self.people_repo.create("Ada", "Engineer")
+        changes = self.service.changes_since(None)
+        self.assertTrue(changes["reset"])
+        self.assertEqual(changes["token"], "1")
+        self.assertEqual(changes["people"]["upserts"][0]["name"], "Ada")
+
+    def test_delta_contains_only_new_rows_and_tombstones(self):
+        client_id = self.clients_repo.create("Acme")
+        project_id = self.projects_repo.create("Website", client_id)
+        person_id = self.people_repo.create("Ada", "Engineer")
+        self.assignments_repo.create(person_id, project_id, "2026-01-01", "2026-01-14", 50)
+        token = int(self.service.changes_since(None)["token"])
+
+        other_id = self.people_repo.create("Grace", "Manager")
+        self.people_repo.update(other_id, "Grace", "Director")
+        self.projects_repo.delete(project_id)
+
+        changes = self.service.changes_since(token)
+        self.assertFalse(changes["reset"])
+        self.assertEqual([row["role"] for row in changes["people"]["upserts"]], ["Director"])
+        self.assertEqual(changes["projects"]["deletes"], [project_id])
+        self.assertEqual(len(changes["assignments"]["deletes"]), 1)
+        self.assertEqual(changes["clients"], {"upserts": [], "deletes": []})
+
+    def test_clear_forces_snapshot(self):
+        self.people_repo.create("Ada", "Engineer")
+        token = int(self.service.changes_since(None)["token"])
+        with self.change_log_repo._connection_provider.get_connection() as conn:
+            conn.execute(text("DELETE FROM people"))
+            self.change_log_repo.reset(conn)
+
+        changes = self.service.changes_since(token)
+        self.assertTrue(changes["reset"])
+        self.assertEqual(changes["people"]["upserts"], [])
+
+    def test_unchanged_token_returns_an_empty_delta(self):
+        for name in ("Ada", "Grace", "Linus"):
+            self.people_repo.create(name, "Engineer")
+        token = int(self.service.changes_since(None)["token"])
+
+        unchanged = self.service.changes_since(token)
+        self.assertFalse(unchanged["reset"])
+        self.assertEqual(unchanged["people"], {"upserts": [], "deletes": []})
+
+    def _commit_person(self, version, name, changed_at=None):
+        """Commit a person as a write that was handed ``version`` earlier would."""
+
+        with self.change_log_repo._connection_provider.get_connection() as conn:
+            person_id = conn.execute(
+                text("INSERT INTO people (name, role) VALUES (:name, 'Engineer') RETURNING id"),
+                {"name": name},
+            ).scalar_one()
+            conn.execute(
+                text(
+                    "INSERT INTO change_log (version, entity, entity_id, op, changed_at) "
+                    "VALUES (:version, 'people', :entity_id, 'create', COALESCE(:changed_at, CURRENT_TIMESTAMP))"
+                ),
+                {"version": version, "entity_id": person_id, "changed_at": changed_at},
+            )
+
+    def test_lower_version_committed_after_a_higher_one_is_delivered(self):
+        self.people_repo.create("Ada", "Engineer")
+        token = self.service.changes_since(None)["token"]
+        self.assertEqual(token, "1")
+
+        # Version 2 belongs to a transaction that is still running.
+        self._commit_person(3, "Grace")
+        changes = self.service.changes_since(int(token))
+        self.assertEqual([row["name"] for row in changes["people"]["upserts"]], ["Grace"])
+        self.assertEqual(changes["token"], "1")
+
+        self._commit_person(2, "Linus")
+        changes = self.service.changes_since(int(changes["token"]))
+        self.assertEqual(
+            sorted(row["name"] for row in changes["people"]["upserts"]), ["Grace", "Linus"]
+        )
+        self.assertEqual(changes["token"], "3")
+        self.assertEqual(self.service.changes_since(3)["people"], {"upserts": [], "deletes": []})
+
+    def test_snapshot_token_stays_below_versions_still_in_flight(self):
+        self.people_repo.create("Ada", "Engineer")
+        self._commit_person(3, "Grace")
+        self.assertEqual(self.service.changes_since(None)["token"], "1")
+
+    def test_missing_version_settles_once_the_next_one_is_old(self):
+        # SQLite's CURRENT_TIMESTAMP is UTC text.
+        earlier = (datetime.now(timezone.utc) - timedelta(minutes=10)).strftime("%Y-%m-%d %H:%M:%S")
+        self._commit_person(1, "Ada", earlier)
+        self._commit_person(3, "Grace", earlier)
+        self.assertEqual(self.change_log_repo.watermark(), (1, 3, 1))
+        self._commit_person(4, "Linus")
+        self.assertEqual(self.change_log_repo.watermark(), (1, 4, 4))
+
+    def test_prune_keeps_the_newest_version(self):
+        for name in ("Ada", "Grace", "Linus"):
+            self.people_repo.create(name, "Engineer")
+        token = int(self.service.changes_since(None)["token"])
+
+        pruned = self.change_log_repo.prune(datetime.now() + timedelta(days=1))
+        self.assertEqual(pruned, 2)
+        self.assertEqual(self.change_log_repo.bounds(), (token, token))
+        self.assertFalse(self.service.changes_since(token)["reset"])
+        # History after version 1 is gone, so that token needs a snapshot.
+        self.assertTrue(self.service.changes_since(1)["reset"])
+
+
+class ChangeLogFeedWatermarkTests(unittest.TestCase):
+    def test_cache_catches_up_on_a_version_committed_late(self):
+        provider = SQLiteConnectionProvider()
+        people_repo = backend_module.PeopleRepository(provider)
+        feed = backend_module.ChangeLogFeed(
+            backend_module.ChangeLogRepository(provider), {"people": people_repo}, interval=0
+        )
+        index = backend_module.SearchIndex({"people": people_repo}, feed)
+        people_repo.create("Ada Lovelace", "Engineer")
+        self.assertEqual(len(index.search("lovelace")), 1)
+
+        def commit(version, name):
+            with provider.get_connection() as conn:
+                person_id = conn.execute(
+                    text("INSERT INTO people (name, role) VALUES (:name, 'Engineer') RETURNING id"),
+                    {"name": name},
+                ).scalar_one()
+                conn.execute(
+                    text(
+                        "INSERT INTO change_log (version, entity, entity_id, op) "
+                        "VALUES (:version, 'people', :entity_id, 'create')"
+                    ),
+                    {"version": version, "entity_id": person_id},
+                )
+
+        commit(3, "Grace Hopper")
+        self.assertEqual(len(index.search("hopper")), 1)
+        self.assertEqual(feed.last_id, 1)
+        commit(2, "Linus Torvalds")
+        self.assertEqual(len(index.search("torvalds")), 1)
+        self.assertEqual(feed.last_id, 3)
+
+
+class ArchiveRoutePruneTests(unittest.TestCase):
+    def test_archive_prunes_change_log_past_retention(self):
+        api = make_api()
+        api.change_log_retention = timedelta(days=-1)
+        for name in ("Ada", "Grace", "Linus"):
+            api.people_repo.create(name, "Engineer")
+
+        response = api.app.test_client().post("/api/archive", json={"before": "2024-01-01"})
+        self.assertEqual(response.get_json()["changeLogPruned"], 2)
+        self.assertEqual(api.change_log_repo.bounds(), (3, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import NullPool, StaticPool
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import TEST_DATABASE_URL
+
+
+class FakeProvider:
+    def __init__(self):
+        self.available = 5
+        self.pings = 0
+        self.error = None
+        self.release = threading.Event()
+        self.release.set()
+
+    def pool_status(self):
+        return {"size": 5, "checkedOut": 5 - self.available, "capacity": 5, "available": self.available}
+
+    def ping(self):
+        self.pings += 1
+        self.release.wait()
+        if self.error:
+            raise RuntimeError(self.error)
+
+
+def readiness_after_ping(monitor):
+    """Start the due ping, let it finish, then read the report it feeds."""
+
+    monitor.readiness()
+    monitor._ping_thread.join(5)
+    return monitor.readiness()
+
+
+class HealthMonitorTests(unittest.TestCase):
+    def setUp(self):
+        self.provider = FakeProvider()
+        self.latency = backend_module.LatencyTracker(size=100)
+        self.monitor = backend_module.HealthMonitor(
+            self.provider, self.latency, ping_interval=60, ping_timeout=0.05, cache_ttl=0
+        )
+
+    def test_ready_when_pool_ping_and_latency_are_healthy(self):
+        for _ in range(100):
+            self.latency.record(0.01)
+        ready, report = readiness_after_ping(self.monitor)
+        self.assertTrue(ready)
+        self.assertEqual(report["latency"]["p99Ms"], 10.0)
+
+        # The ping result is reused until the interval passes.
+        self.monitor.readiness()
+        self.assertEqual(self.provider.pings, 1)
+
+    def test_not_ready_until_the_first_ping_finishes(self):
+        self.provider.release.clear()
+        ready, report = self.monitor.readiness()
+        self.assertFalse(ready)
+        self.assertEqual(report["database"]["error"], "not checked yet")
+        self.provider.release.set()
+
+    def test_degraded_on_exhausted_pool_or_slow_requests(self):
+        self.provider.available = 0
+        self.latency.record(5.0)
+        ready, report = readiness_after_ping(self.monitor)
+        self.assertFalse(ready)
+        self.assertEqual(
+            report["problems"], ["connection pool exhausted", "p99 latency over budget"]
+        )
+
+    def test_hung_ping_times_out_without_piling_up(self):
+        self.provider.release.clear()
+        self.monitor.readiness()
+        time.sleep(0.06)
+        ready, report = self.monitor.readiness()
+        self.assertFalse(ready)
+        self.assertIn("exceeded", report["database"]["error"])
+        self.monitor.readiness()
+        self.assertEqual(self.provider.pings, 1)
+        self.provider.release.set()
+
+    def test_probes_never_wait_for_a_slow_ping(self):
+        monitor = backend_module.HealthMonitor(
+            self.provider, self.latency, ping_interval=60, ping_timeout=5, cache_ttl=60
+        )
+        self.provider.release.clear()
+        started = time.perf_counter()
+        monitor.readiness()
+        # A cached report is served even while another probe holds the lock.
+        with monitor._lock:
+            monitor.readiness()
+        self.assertLess(time.perf_counter() - started, 1)
+        self.provider.release.set()
+        monitor._ping_thread.join(5)
+        self.assertTrue(monitor.readiness()[0])
+
+    def test_failed_ping_is_reported(self):
+        self.provider.error = "ORA-03113: end-of-file on communication channel"
+        ready, report = readiness_after_ping(self.monitor)
+        self.assertFalse(ready)
+        self.assertIn("ORA-03113", report["database"]["error"])
+
+
+class PoolWithoutCountersTests(unittest.TestCase):
+    def _monitor(self, poolclass):
+        provider = backend_module.SQLAlchemyConnectionProvider(
+            backend_module.DatabaseConfig(database_url=TEST_DATABASE_URL)
+        )
+        provider._engine = create_engine("sqlite://", poolclass=poolclass)
+        provider._engine_pid = os.getpid()
+        self.addCleanup(provider._engine.dispose)
+        return backend_module.HealthMonitor(
+            provider, backend_module.LatencyTracker(size=10), ping_interval=60, cache_ttl=0
+        )
+
+    def test_static_and_null_pools_do_not_degrade_readiness(self):
+        for poolclass in (StaticPool, NullPool):
+            with self.subTest(pool=poolclass.__name__):
+                ready, report = readiness_after_ping(self._monitor(poolclass))
+                self.assertTrue(ready, report["problems"])
+                self.assertEqual(report["pool"], {"applicable": False, "pool": poolclass.__name__})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import io
+import json
+import logging
+import sys
+import unittest
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+
+
+class StructuredLoggingTests(unittest.TestCase):
+    def tearDown(self):
+        backend_module.configure_logging(mode="sync")
+
+    def _lines(self, stream):
+        backend_module._stop_log_listener()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    def test_async_json_records_carry_structured_fields(self):
+        stream = io.StringIO()
+        backend_module.configure_logging(mode="async", fmt="json", stream=stream)
+        backend_module.access_logger.info(
+            "GET /api/people 200", extra={"requestId": "r1", "route": "/api/people", "rows": 3}
+        )
+        (record,) = self._lines(stream)
+        self.assertEqual(record["msg"], "GET /api/people 200")
+        self.assertEqual((record["requestId"], record["route"], record["rows"]), ("r1", "/api/people", 3))
+
+    def test_sampling_drops_only_marked_info_records(self):
+        stream = io.StringIO()
+        backend_module.configure_logging(mode="async", fmt="json", sample_rate=0.0, stream=stream)
+        logger = logging.getLogger("backend.test")
+        logger.info("sampled", extra={"sample": True, "requestId": "r2"})
+        logger.warning("kept warning", extra={"sample": True})
+        logger.info("kept info")
+        self.assertEqual([record["msg"] for record in self._lines(stream)], ["kept warning", "kept info"])
+
+
+if __name__ == "__main__":
+    unittest.main()
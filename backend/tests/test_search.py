@@ -0,0 +1,109 @@
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        self.feed = backend_module.ChangeFeed(capacity=100)
+        self.people_repo = backend_module.PeopleRepository(provider, self.feed)
+        self.clients_repo = backend_module.ClientsRepository(provider, self.feed)
+        self.projects_repo = backend_module.ProjectsRepository(provider, self.feed)
+        self.index = backend_module.SearchIndex(
+            {
+                "people": self.people_repo,
+                "clients": self.clients_repo,
+                "projects": self.projects_repo,
+            },
+            self.feed,
+        )
+        self.ada_id = self.people_repo.create("Ada Lovelace", "Engineer")
+        self.people_repo.create("Adam Smith", "Designer")
+        client_id = self.clients_repo.create("Adatum")
+        self.projects_repo.create("Data Platform", client_id)
+
+    def test_prefix_matches_rank_exact_first(self):
+        results = self.index.search("ada")
+        self.assertEqual(results[0]["name"], "Ada Lovelace")
+        self.assertEqual(
+            {result["name"] for result in results},
+            {"Ada Lovelace", "Adam Smith", "Adatum"},
+        )
+        self.assertEqual([r["name"] for r in self.index.search("ada", limit=1)], ["Ada Lovelace"])
+
+    def test_matches_later_words_roles_and_typos(self):
+        self.assertEqual(self.index.search("lovelace")[0]["id"], self.ada_id)
+        designer = self.index.search("design")[0]
+        self.assertEqual((designer["name"], designer["matchedOn"]), ("Adam Smith", "role"))
+        self.assertEqual(self.index.search("platfrom")[0]["name"], "Data Platform")
+        self.assertEqual(self.index.search("ada", entities=["clients"])[0]["type"], "client")
+
+    def test_follows_repository_changes(self):
+        self.index.search("ada")
+        self.people_repo.update(self.ada_id, "Grace Hopper", "Admiral")
+        self.assertEqual(self.index.search("grace")[0]["id"], self.ada_id)
+        self.assertNotIn("Ada Lovelace", [r["name"] for r in self.index.search("ada")])
+
+        self.people_repo.delete(self.ada_id)
+        self.assertEqual(self.index.search("grace"), [])
+
+
+class SearchIndexAcrossWorkersTests(unittest.TestCase):
+    """Two sets of repositories over one database stand in for two uWSGI workers."""
+
+    def setUp(self):
+        provider = self.provider = SQLiteConnectionProvider()
+        self.writer = {
+            "people": backend_module.PeopleRepository(provider, backend_module.ChangeFeed()),
+            "clients": backend_module.ClientsRepository(provider, backend_module.ChangeFeed()),
+            "projects": backend_module.ProjectsRepository(provider, backend_module.ChangeFeed()),
+        }
+        self.assignments_repo = backend_module.AssignmentsRepository(provider, backend_module.ChangeFeed())
+        reader = {
+            "people": backend_module.PeopleRepository(provider),
+            "clients": backend_module.ClientsRepository(provider),
+            "projects": backend_module.ProjectsRepository(provider),
+        }
+        feed = backend_module.ChangeLogFeed(
+            backend_module.ChangeLogRepository(provider), reader, interval=0
+        )
+        self.index = backend_module.SearchIndex(reader, feed)
+        self.ada_id = self.writer["people"].create("Ada Lovelace", "Engineer")
+
+    def _names(self, query):
+        return [result["name"] for result in self.index.search(query)]
+
+    def test_writes_on_another_worker_reach_the_index(self):
+        self.assertEqual(self._names("lovelace"), ["Ada Lovelace"])
+        client_id = self.writer["clients"].create("Globex")
+        self.assertEqual(self._names("globex"), ["Globex"])
+
+        self.writer["people"].update(self.ada_id, "Ada Byron", "Engineer")
+        self.assertEqual(self._names("lovelace"), [])
+        self.assertEqual(self._names("byron"), ["Ada Byron"])
+
+        project_id = self.writer["projects"].create("Moonshot", client_id)
+        self.assignments_repo.create(self.ada_id, project_id, date(2026, 1, 1), date(2026, 1, 31), 50)
+        self.assertEqual(self._names("moonshot"), ["Moonshot"])
+
+        self.writer["people"].delete(self.ada_id)
+        self.assertEqual(self._names("byron"), [])
+
+    def test_pruned_history_rebuilds_the_index(self):
+        self.assertEqual(self._names("lovelace"), ["Ada Lovelace"])
+        self.writer["people"].create("Grace Hopper", "Engineer")
+        self.writer["people"].create("Linus Torvalds", "Engineer")
+        backend_module.ChangeLogRepository(self.provider).prune(datetime.now() + timedelta(days=1))
+        self.assertEqual(self._names("hopper"), ["Grace Hopper"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider, make_api
+
+
+@unittest.skipIf(backend_module.np is None, "numpy is not installed")
+class StaffingServiceTests(unittest.TestCase):
+    def setUp(self):
+        provider = SQLiteConnectionProvider()
+        self.people_repo = backend_module.PeopleRepository(provider)
+        clients_repo = backend_module.ClientsRepository(provider)
+        projects_repo = backend_module.ProjectsRepository(provider)
+        assignments_repo = backend_module.AssignmentsRepository(provider)
+        matrix = backend_module.AllocationMatrix(self.people_repo, projects_repo, assignments_repo)
+        self.service = backend_module.StaffingService(matrix)
+
+        acme = clients_repo.create("Acme")
+        self.acme_project = projects_repo.create("Website", acme)
+        other_project = projects_repo.create("Internal", clients_repo.create("Globex"))
+        self.busy = self.people_repo.create("Busy", "Engineer")
+        self.veteran = self.people_repo.create("Veteran", "Engineer")
+        self.free = self.people_repo.create("Free", "Engineer")
+        self.manager = self.people_repo.create("Manager", "Manager")
+        assignments_repo.create(self.busy, other_project, date(2026, 2, 1), date(2026, 2, 28), 80)
+        assignments_repo.create(self.veteran, self.acme_project, date(2025, 6, 1), date(2025, 12, 31), 100)
+        assignments_repo.create(self.veteran, other_project, date(2026, 2, 1), date(2026, 2, 28), 25)
+        self.window = (date(2026, 2, 1), date(2026, 2, 28))
+
+    def _suggest(self, **kwargs):
+        options = {"role": "engineer", "percentage": 50, "headcount": 2, "project_id": self.acme_project}
+        options.update(kwargs)
+        return self.service.suggest(start=self.window[0], end=self.window[1], **options)
+
+    def test_prefers_client_continuity_and_skips_over_allocation(self):
+        for mode in ("greedy", "bnb"):
+            result = self._suggest(mode=mode)
+            self.assertEqual([c["personId"] for c in result["candidates"]], [self.veteran, self.free])
+            self.assertEqual(result["shortfall"], 0)
+            self.assertTrue(result["complete"])
+
+    def test_reports_shortfall_when_nobody_else_fits(self):
+        result = self._suggest(percentage=80, headcount=3, mode="bnb")
+        self.assertEqual([c["personId"] for c in result["candidates"]], [self.free])
+        self.assertEqual(result["shortfall"], 2)
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            self._suggest(mode="random")
+
+
+@unittest.skipIf(backend_module.np is None, "numpy is not installed")
+class StaffingRouteTests(unittest.TestCase):
+    def setUp(self):
+        self.api = make_api()
+        self.client = self.api.app.test_client()
+
+        self.project_id = self.api.projects_repo.create("Website", self.api.clients_repo.create("Acme"))
+        self.people = [self.api.people_repo.create(f"Engineer {index}", "Engineer") for index in range(300)]
+        self.api.assignments_repo.create(
+            self.people[0], self.project_id, date(2026, 2, 1), date(2026, 2, 28), 100
+        )
+
+    def _post(self, **overrides):
+        payload = {"role": "Engineer", "startDate": "2026-02-01", "endDate": "2026-02-28"}
+        payload.update(overrides)
+        return self.client.post("/api/staffing/suggest", json=payload)
+
+    def test_defaults_to_one_full_time_greedy_candidate(self):
+        response = self._post()
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertEqual(body["mode"], "greedy")
+        self.assertEqual(len(body["candidates"]), 1)
+        self.assertEqual(body["candidates"][0]["percentage"], 100)
+        self.assertNotEqual(body["candidates"][0]["personId"], self.people[0])
+
+    def test_rejects_invalid_headcount(self):
+        for headcount in (0, -1, "many", None):
+            with self.subTest(headcount=headcount):
+                self.assertEqual(self._post(headcount=headcount).status_code, 400)
+
+    def test_rejects_invalid_percentage_and_mode(self):
+        self.assertEqual(self._post(percentage=0).status_code, 400)
+        self.assertEqual(self._post(percentage=150).status_code, 400)
+        self.assertEqual(self._post(mode="random").status_code, 400)
+
+    def test_requires_role_and_parseable_dates(self):
+        self.assertEqual(self.client.post("/api/staffing/suggest", json={}).status_code, 400)
+        self.assertEqual(self._post(startDate="01/02/2026").status_code, 400)
+        self.assertEqual(self._post(startDate=None, endDate=None).status_code, 400)
+        self.assertEqual(self._post(startDate="2026-03-01").status_code, 400)
+
+    def test_accepts_a_period_instead_of_dates(self):
+        response = self.client.post("/api/staffing/suggest", json={"role": "Engineer", "period": 1})
+        self.assertEqual(response.status_code, 200)
+        candidate = response.get_json()["candidates"][0]
+        self.assertLess(candidate["startDate"], candidate["endDate"])
+        self.assertEqual(self._post(startDate=None, endDate=None, period="soon").status_code, 400)
+
+    def test_returns_partial_result_when_time_budget_runs_out(self):
+        response = self._post(headcount=len(self.people), mode="bnb", timeBudgetMs=0)
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertFalse(body["complete"])
+        self.assertEqual(body["evaluated"], backend_module.StaffingService.BLOCK_SIZE)
+        self.assertEqual(body["shortfall"], len(self.people) - len(body["candidates"]))
+
+    def test_completes_when_budget_allows(self):
+        response = self._post(headcount=2, mode="bnb", timeBudgetMs=5000)
+        body = response.get_json()
+        self.assertTrue(body["complete"])
+        self.assertEqual(body["shortfall"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy import event
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_ROOT))
+
+import backend as backend_module
+from sqlite_support import SQLiteConnectionProvider
+
+
+class RecordSchemaTests(unittest.TestCase):
+    def test_accepts_camel_snake_and_string_values(self):
+        values, errors = backend_module.ASSIGNMENT_SCHEMA.validate(
+            {
+                "person_id": "3",
+                "projectId": 4,
+                "start_date": "2026-01-01",
+                "endDate": "2026-01-31",
+                "percentage": "",
+            }
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual(values["personId"], 3)
+        self.assertEqual(values["startDate"], date(2026, 1, 1))
+        self.assertEqual(values["percentage"], 100)
+
+    def test_period_fills_dates(self):
+        values, errors = backend_module.ASSIGNMENT_SCHEMA.validate(
+            {"personId": 1, "projectId": 2, "period": "1"}
+        )
+        self.assertEqual(errors, [])
+        self.assertEqual((values["startDate"], values["endDate"]), (date(2026, 1, 15), date(2026, 1, 28)))
+
+    def test_collects_every_error_in_a_row(self):
+        _, errors = backend_module.ASSIGNMENT_SCHEMA.validate(
+            {"personId": "abc", "projectId": 2, "startDate": "01/02/2026", "endDate": "2026-01-31", "percentage": "x"}
+        )
+        self.assertEqual(len(errors), 3)
+
+    def test_batch_reports_row_indexes(self):
+        rows, failures = backend_module.PERSON_SCHEMA.validate_batch(
+            [{"name": "Ada", "role": "Engineer"}, {"name": "  "}, "oops"]
+        )
+        self.assertEqual(rows[0], {"name": "Ada", "role": "Engineer"})
+        self.assertEqual([failure["row"] for failure in failures], [1, 2])
+        self.assertEqual(len(failures[0]["errors"]), 2)
+
+
+class BulkUploadServiceTests(unittest.TestCase):
+    def setUp(self):
+        provider = self.provider = SQLiteConnectionProvider()
+        self.people_repo = backend_module.PeopleRepository(provider)
+        self.clients_repo = backend_module.ClientsRepository(provider)
+        self.projects_repo = backend_module.ProjectsRepository(provider)
+        self.assignments_repo = backend_module.AssignmentsRepository(provider)
+        self.service = backend_module.BulkUploadService(
+            self.people_repo, self.clients_repo, self.projects_repo, self.assignments_repo
+        )
+        client_id = self.clients_repo.create("Acme Corp")
+        self.person_id = self.people_repo.create("John Doe", "Engineer")
+        self.project_id = self.projects_repo.create("Website Redesign", client_id)
+
+    def test_resolves_names_case_insensitively(self):
+        rows = self.service.normalize_assignments(
+            [
+                {
+                    "person_name": " john doe ",
+                    "project_name": "website redesign",
+                    "client_name": "ACME CORP",
+                    "start_date": "2024-01-01",
+                    "end_date": "2024-01-31",
+                    "percentage": 50,
+                }
+            ]
+        )
+        self.assertEqual((rows[0]["personId"], rows[0]["projectId"]), (self.person_id, self.project_id))
+
+    def test_rejects_whole_batch_with_all_failures(self):
+        payload = [
+            {"personId": self.person_id, "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"},
+            {"personName": "Nobody", "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"},
+            {"personId": self.person_id, "projectName": "Website Redesign", "clientName": "Globex", "period": 2},
+        ]
+        with self.assertRaises(backend_module.ValidationError) as ctx:
+            self.service.bulk_assignments(payload)
+        self.assertEqual([failure["row"] for failure in ctx.exception.failures], [1, 2])
+        self.assertEqual(self.assignments_repo.list(), [])
+
+    def test_reports_unknown_ids_per_row(self):
+        payload = [
+            {"personId": self.person_id, "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"},
+            {"personId": 999, "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"},
+            {"personId": self.person_id, "projectId": 998, "startDate": "2024-01-01", "endDate": "2024-01-31"},
+        ]
+        with self.assertRaises(backend_module.ValidationError) as ctx:
+            self.service.bulk_assignments(payload)
+        self.assertEqual(
+            ctx.exception.failures,
+            [
+                {"row": 1, "errors": ["Person not found: id 999"]},
+                {"row": 2, "errors": ["Project not found: id 998"]},
+            ],
+        )
+        self.assertEqual(self.assignments_repo.list(), [])
+
+    def test_lookups_run_one_query_per_table_and_skip_empty_inputs(self):
+        transactions = []
+        event.listen(self.provider._engine, "begin", transactions.append)
+
+        by_id = {"personId": self.person_id, "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"}
+        self.service.normalize_assignments([by_id])
+        self.assertEqual(len(transactions), 2)
+
+        del transactions[:]
+        self.assertEqual(self.people_repo.get_many([]), [])
+        self.assertEqual(self.people_repo.get_ids_by_names([]), {})
+        self.assertEqual(transactions, [])
+
+    def test_bulk_assignments_upserts_on_natural_key(self):
+        row = {"personId": self.person_id, "projectId": self.project_id, "startDate": "2024-01-01", "endDate": "2024-01-31"}
+        first = self.service.bulk_assignments([row])
+        second = self.service.bulk_assignments([{**row, "percentage": 40}])
+        self.assertEqual(first[0]["id"], second[0]["id"])
+        self.assertEqual(self.assignments_repo.list()[0]["percentage"], 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
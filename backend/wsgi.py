@@ -1,7 +1,34 @@
-from backend import DatabaseConfig, ResourcePlannerAPI
+import os
+import threading
 
-config = DatabaseConfig()
-api = ResourcePlannerAPI(config)
+from backend import get_api
+
+api = get_api()
 api.init_database()
 
 app = api.app
+
+
+def _start_warm_up() -> threading.Thread:
+    # Warm up off the request path so the worker starts accepting requests at once.
+    thread = threading.Thread(target=api.warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+
+def _schedule_warm_up() -> None:
+    try:
+        import uwsgi
+        from uwsgidecorators import postfork
+    except ImportError:
+        _start_warm_up()
+        return
+    if uwsgi.opt.get("lazy-apps") or uwsgi.opt.get("lazy"):
+        # The app is loaded inside the worker already.
+        _start_warm_up()
+    else:
+        postfork(_start_warm_up)
+
+
+if os.environ.get("WARM_UP_ON_START", "").lower() in ("1", "true", "yes"):
+    _schedule_warm_up()
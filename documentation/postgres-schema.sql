@@ -29,6 +29,10 @@ CREATE TABLE assignments (
     start_date DATE NOT NULL,
     end_date DATE NOT NULL,
     percentage NUMERIC DEFAULT 100,
+    -- Bumped by every update; PUT /api/assignments/<id> accepts If-Match.
+    version INTEGER DEFAULT 1 NOT NULL,
+    CONSTRAINT uq_assignments_natural_key
+        UNIQUE (person_id, project_id, start_date, end_date),
     CONSTRAINT fk_assignments_person
         FOREIGN KEY (person_id) REFERENCES people(id),
     CONSTRAINT fk_assignments_project
@@ -37,3 +41,49 @@ CREATE TABLE assignments (
 
 CREATE INDEX idx_assignments_person ON assignments(person_id);
 CREATE INDEX idx_assignments_project ON assignments(project_id);
+CREATE INDEX idx_assignments_end_date ON assignments(end_date);
+
+-- Existing databases: remove duplicate assignments before adding the key.
+-- DELETE FROM assignments a WHERE EXISTS (
+--     SELECT 1 FROM assignments b
+--     WHERE b.person_id = a.person_id AND b.project_id = a.project_id
+--       AND b.start_date = a.start_date AND b.end_date = a.end_date AND b.id < a.id);
+-- ALTER TABLE assignments ADD COLUMN version INTEGER DEFAULT 1 NOT NULL;
+-- ALTER TABLE assignments_archive ADD COLUMN version INTEGER DEFAULT 1 NOT NULL;
+-- ALTER TABLE assignments ADD CONSTRAINT uq_assignments_natural_key
+--     UNIQUE (person_id, project_id, start_date, end_date);
+
+-- Case-insensitive name lookups (bulk upload resolution)
+CREATE INDEX idx_people_name_lower ON people(LOWER(name));
+CREATE INDEX idx_clients_name_lower ON clients(LOWER(name));
+CREATE INDEX idx_projects_name_lower ON projects(LOWER(name), client_id);
+
+-- Finished assignments moved out of the hot table by POST /api/archive.
+-- Rows keep their original ids; reads only reach here when the requested
+-- date range starts on or before MAX(end_date).
+CREATE TABLE assignments_archive (
+    id INTEGER PRIMARY KEY,
+    person_id INTEGER NOT NULL,
+    project_id INTEGER NOT NULL,
+    start_date DATE NOT NULL,
+    end_date DATE NOT NULL,
+    percentage NUMERIC DEFAULT 100,
+    version INTEGER DEFAULT 1 NOT NULL,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_assignments_archive_person ON assignments_archive(person_id);
+CREATE INDEX idx_assignments_archive_project ON assignments_archive(project_id);
+CREATE INDEX idx_assignments_archive_end_date ON assignments_archive(end_date);
+
+-- Change tracking for GET /api/changes. Every repository write appends a row
+-- in the same transaction; /api/clear-all truncates it to a single marker.
+CREATE TABLE change_log (
+    version BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    entity VARCHAR(32) NOT NULL,
+    entity_id INTEGER,
+    op VARCHAR(16) NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+CREATE INDEX idx_change_log_changed_at ON change_log(changed_at);